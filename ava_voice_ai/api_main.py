@@ -10,18 +10,23 @@ Features:
 """
 
 import os
+import re
 import sys
+import logging
 from pathlib import Path
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, HTTPException, UploadFile, File
-from fastapi.responses import FileResponse, JSONResponse
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import FastAPI, HTTPException, UploadFile, File, Response, Request, Depends
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+from anyio import to_thread, CapacityLimiter
+import httpx
 import uvicorn
 import asyncio
-import threading
-from typing import Optional, Dict, Any
+import time
+from typing import Optional, Dict, Any, Callable, Tuple
 import json
 
 # Set UTF-8 encoding for Windows
@@ -33,6 +38,9 @@ if sys.platform.startswith('win'):
     if hasattr(sys.stderr, 'reconfigure'):
         sys.stderr.reconfigure(encoding='utf-8')
 
+# Show service status messages from the core modules (each worker process imports this module)
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
 # Add the project root to Python path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
@@ -41,37 +49,116 @@ from core.voice_input import VoiceInput
 from core.gemini_response import GeminiResponse
 from core.murf_tts import MurfTTS
 
-# Initialize services
-voice_input: Optional[VoiceInput] = None
-gemini_response: Optional[GeminiResponse] = None
-murf_tts: Optional[MurfTTS] = None
+# Worker threads for each of the two thread pools: anyio's (sync endpoints
+# and file responses) and the event loop's default executor (asyncio.to_thread
+# calls here and in the core modules)
+THREADPOOL_SIZE = 8
+
+# Microphone captures at a time: sr.Microphone can't be opened twice, and a
+# capture blocks for up to timeout + phrase_time_limit seconds on its own
+# thread, outside the shared pool's limit
+VOICE_THREADS = 1
+
+# Concurrent TTS conversions allowed so long /murf calls can't starve /voice
+MAX_CONCURRENT_TTS = 4
+
+# Seconds clients may reuse the Murf voice list; kept short because the
+# server drops to the fallback catalog as soon as Murf stops working
+VOICES_MAX_AGE = 60
+
+# Origins allowed to call the API from a browser context
+CORS_ORIGINS = ["http://localhost:5173", "http://127.0.0.1:5173", "null"]
+
+# Generated audio that clients may delete: one-off speech files and cached Murf audio
+_AUDIO_NAME_RE = re.compile(r"ava_speech_[A-Za-z0-9_-]+\.(?:mp3|wav)|ava_cache_[0-9a-f]+\.mp3")
+
+# Cached results of service probes: name -> (result, expiry timestamp)
+_probe_cache: Dict[str, Tuple[bool, float]] = {}
+
+# Gemini calls in flight by message text, so duplicate submissions share one reply
+_gemini_inflight: Dict[str, "asyncio.Task[Optional[str]]"] = {}
+
+def _cached_probe(name: str, probe: Callable[[], bool], ttl: float = 30) -> bool:
+    """Run a service probe at most once per `ttl` seconds and cache the result"""
+    cached = _probe_cache.get(name)
+    now = time.monotonic()
+    if cached and cached[1] > now:
+        return cached[0]
+    
+    result = probe()
+    _probe_cache[name] = (result, now + ttl)
+    return result
+
+async def _cached_probe_async(name: str, probe: Callable[[], bool], ttl: float = 30) -> bool:
+    """Like _cached_probe, but runs an expired probe on a worker thread"""
+    cached = _probe_cache.get(name)
+    if cached and cached[1] > time.monotonic():
+        return cached[0]
+    return await asyncio.to_thread(_cached_probe, name, probe, ttl)
+
+async def _probe_unavailable() -> bool:
+    """Probe result for a service that failed to start"""
+    return False
+
+async def _gemini_once(gemini_response: GeminiResponse, text: str) -> Optional[str]:
+    """Get a Gemini reply, joining an identical request that is already in flight"""
+    key = text.strip()
+    task = _gemini_inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(gemini_response.get_response_async(text))
+        _gemini_inflight[key] = task
+        task.add_done_callback(lambda _: _gemini_inflight.pop(key, None))
+    # A disconnecting client must not cancel the call for the others waiting on it
+    return await asyncio.shield(task)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Handle startup and shutdown events"""
-    global voice_input, gemini_response, murf_tts
-    
     # Startup
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=THREADPOOL_SIZE, thread_name_prefix="api")
+    )
+    app.state.voice_limiter = CapacityLimiter(VOICE_THREADS)
+    app.state.tts_slots = asyncio.Semaphore(MAX_CONCURRENT_TTS)
+    Path(audio_dir).mkdir(parents=True, exist_ok=True)
+    
+    # Pooled keep-alive clients shared by outbound TTS requests (blocking
+    # callers such as the desktop speak path, and the async endpoints)
+    app.state.http = httpx.Client(
+        limits=httpx.Limits(max_keepalive_connections=20),
+        timeout=15
+    )
+    app.state.ahttp = httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=20),
+        timeout=15
+    )
+    
+    # Services live on app.state so each worker process owns its own instances
+    app.state.voice_input = None
+    app.state.gemini = None
+    app.state.murf = None
+    
     try:
         print("Initializing Ava AI services...")
         
         # Initialize Voice Input
-        voice_input = VoiceInput()
-        if not voice_input.test_microphone():
+        app.state.voice_input = VoiceInput()
+        if not _cached_probe("mic", app.state.voice_input.test_microphone):
             print("WARNING: Microphone test failed")
         else:
             print("SUCCESS: Voice input initialized")
         
         # Initialize Gemini
-        gemini_response = GeminiResponse()
-        if not gemini_response.test_connection():
+        app.state.gemini = GeminiResponse()
+        if not _cached_probe("gemini", app.state.gemini.test_connection):
             print("WARNING: Gemini AI connection failed")
         else:
             print("SUCCESS: Gemini AI initialized")
         
         # Initialize Murf TTS
-        murf_tts = MurfTTS()
-        if not murf_tts.test_connection():
+        app.state.murf = MurfTTS(http_client=app.state.http, async_http_client=app.state.ahttp)
+        if not _cached_probe("murf", app.state.murf.test_connection):
             print("WARNING: Murf TTS connection failed")
         else:
             print("SUCCESS: Murf TTS initialized")
@@ -86,6 +173,12 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     print("Shutting down Ava AI services...")
+    if app.state.voice_input:
+        app.state.voice_input.close()
+    if app.state.murf:
+        app.state.murf.stop_audio()
+    app.state.http.close()
+    await app.state.ahttp.aclose()
 
 # Initialize FastAPI app with lifespan
 app = FastAPI(
@@ -95,59 +188,113 @@ app = FastAPI(
     lifespan=lifespan
 )
 
-# Configure CORS
+# Configure CORS for the Electron app: the Vite dev server in development, and
+# pages loaded from file:// (sent as the "null" origin) in the packaged app.
+# The app sends no cookies or auth headers, so credentials stay disallowed.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify your Electron app's origin
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=CORS_ORIGINS,
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["content-type"],
 )
 
+class AudioFiles(StaticFiles):
+    """Static files for generated speech, which is never rewritten once saved"""
+    
+    async def get_response(self, path: str, scope):
+        response = await super().get_response(path, scope)
+        # FileResponse already sets ETag/Last-Modified; let clients keep the file
+        if response.status_code in (200, 206, 304):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
 # Serve static audio files
 audio_dir = os.path.join(os.path.dirname(__file__), "assets", "audio")
-os.makedirs(audio_dir, exist_ok=True)
-app.mount("/audio", StaticFiles(directory=audio_dir), name="audio")
 
 # Request/Response Models
+# Request bodies are read-only; unknown fields (such as the conversation_history
+# older clients still send) are dropped rather than rejected
+REQUEST_MODEL_CONFIG = ConfigDict(frozen=True, extra='ignore')
+
 class VoiceRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+    
     timeout: int = 10
     phrase_time_limit: int = 15
 
 class GeminiRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+    
     text: str
-    conversation_history: Optional[list] = None
 
 class TTSRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+    
     text: str
     voice_id: Optional[str] = None
     style: Optional[str] = None
     speed: float = 1.0
 
+# Response models: FastAPI serializes these straight to JSON bytes with
+# Pydantic (endpoints leave out fields that are None)
 class APIResponse(BaseModel):
     success: bool
-    data: Optional[Dict[Any, Any]] = None
+    data: Optional[Dict[str, Any]] = None
     message: Optional[str] = None
     error: Optional[str] = None
 
+class ServiceInfo(BaseModel):
+    message: str
+    version: str
+    status: str
+
+# Service dependencies
+async def get_voice_input(request: Request) -> VoiceInput:
+    """Resolve the worker's voice input service"""
+    if not request.app.state.voice_input:
+        raise HTTPException(status_code=503, detail="Voice input service not available")
+    return request.app.state.voice_input
+
+async def get_gemini(request: Request) -> GeminiResponse:
+    """Resolve the worker's Gemini service"""
+    if not request.app.state.gemini:
+        raise HTTPException(status_code=503, detail="Gemini AI service not available")
+    return request.app.state.gemini
+
+async def get_murf(request: Request) -> MurfTTS:
+    """Resolve the worker's Murf TTS service"""
+    if not request.app.state.murf:
+        raise HTTPException(status_code=503, detail="Murf TTS service not available")
+    return request.app.state.murf
+
 # API Endpoints
             
 @app.get("/")
-async def root():
+async def root() -> ServiceInfo:
     """Root endpoint"""
-    return {
-        "message": "Ava AI Voice Assistant API", 
-        "version": "1.0.0",
-        "status": "running"
-    }
+    return ServiceInfo(
+        message="Ava AI Voice Assistant API",
+        version="1.0.0",
+        status="running"
+    )
 
-@app.get("/status")
-async def get_status():
+@app.get("/status", response_model_exclude_none=True)
+async def get_status(request: Request) -> APIResponse:
     """Get service status"""
+    voice_input = request.app.state.voice_input
+    gemini_response = request.app.state.gemini
+    murf_tts = request.app.state.murf
+    
+    # Probes hit the mic and the network; run expired ones concurrently off the event loop
+    voice_ok, gemini_ok, murf_ok = await asyncio.gather(
+        _cached_probe_async("mic", voice_input.test_microphone) if voice_input else _probe_unavailable(),
+        _cached_probe_async("gemini", gemini_response.test_connection) if gemini_response else _probe_unavailable(),
+        _cached_probe_async("murf", murf_tts.test_connection) if murf_tts else _probe_unavailable()
+    )
     status = {
-        "voice_input": voice_input.test_microphone() if voice_input else False,
-        "gemini_ai": gemini_response.test_connection() if gemini_response else False,
-        "murf_tts": murf_tts.test_connection() if murf_tts else False
+        "voice_input": voice_ok,
+        "gemini_ai": gemini_ok,
+        "murf_tts": murf_ok
     }
     
     return APIResponse(
@@ -156,20 +303,22 @@ async def get_status():
         message="Service status retrieved"
     )
 
-@app.post("/voice")
-async def start_voice_recognition(request: VoiceRequest):
+@app.post("/voice", response_model_exclude_none=True)
+async def start_voice_recognition(request: VoiceRequest, http_request: Request,
+                                  voice_input: VoiceInput = Depends(get_voice_input)) -> APIResponse:
     """Start voice recognition and return transcribed text"""
-    if not voice_input:
-        raise HTTPException(status_code=503, detail="Voice input service not available")
+    voice_limiter = http_request.app.state.voice_limiter
+    if voice_limiter.available_tokens == 0:
+        raise HTTPException(status_code=503, detail="Microphone is busy with another recognition, try again shortly")
     
     try:
-        # Run voice recognition in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        text = await loop.run_in_executor(
-            None, 
-            voice_input.listen_once, 
-            request.timeout, 
-            request.phrase_time_limit
+        # Blocking mic capture on the thread reserved for it (the limiter also
+        # queues a request that races past the busy check)
+        text = await to_thread.run_sync(
+            voice_input.listen_once,
+            request.timeout,
+            request.phrase_time_limit,
+            limiter=voice_limiter
         )
         
         if text:
@@ -188,20 +337,13 @@ async def start_voice_recognition(request: VoiceRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Voice recognition failed: {str(e)}")
 
-@app.post("/gemini")
-async def get_gemini_response(request: GeminiRequest):
+@app.post("/gemini", response_model_exclude_none=True)
+async def get_gemini_response(request: GeminiRequest,
+                              gemini_response: GeminiResponse = Depends(get_gemini)) -> APIResponse:
     """Get AI response from Gemini"""
-    if not gemini_response:
-        raise HTTPException(status_code=503, detail="Gemini AI service not available")
-    
     try:
-        # Run Gemini request in thread pool
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            gemini_response.get_response,
-            request.text
-        )
+        # Gemini is a single outbound HTTPS call, await it on the event loop
+        response = await _gemini_once(gemini_response, request.text)
         
         if response:
             return APIResponse(
@@ -218,25 +360,56 @@ async def get_gemini_response(request: GeminiRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Gemini AI error: {str(e)}")
 
-@app.post("/murf")
-async def convert_to_speech(request: TTSRequest):
+@app.post("/gemini/stream")
+async def stream_gemini_response(request: GeminiRequest, gemini_response: GeminiResponse = Depends(get_gemini)):
+    """Stream the AI response from Gemini as Server-Sent Events"""
+    async def events():
+        async for text in gemini_response.get_response_stream(request.text):
+            yield f"data: {json.dumps({'token': text})}\n\n"
+        yield "event: done\ndata: {}\n\n"
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+def _tts_slot_free(tts_slots: asyncio.Semaphore):
+    """Reject the request when every TTS slot is taken"""
+    if tts_slots.locked():
+        raise HTTPException(status_code=503, detail="Too many text-to-speech requests, try again shortly")
+
+async def _release_after_stream(chunks, tts_slots: asyncio.Semaphore):
+    """Forward streamed audio, freeing the TTS slot once the stream ends"""
+    try:
+        # Primed by the endpoint so this cleanup runs even if the client
+        # disconnects before the first chunk
+        yield b""
+        async for chunk in chunks:
+            yield chunk
+    finally:
+        await chunks.aclose()
+        tts_slots.release()
+
+@app.post("/murf", response_model_exclude_none=True)
+async def convert_to_speech(request: TTSRequest, http_request: Request,
+                            murf_tts: MurfTTS = Depends(get_murf)) -> APIResponse:
     """Convert text to speech using Murf TTS"""
-    if not murf_tts:
-        raise HTTPException(status_code=503, detail="Murf TTS service not available")
+    tts_slots = http_request.app.state.tts_slots
+    _tts_slot_free(tts_slots)
+    await tts_slots.acquire()
     
     try:
-        # Run TTS in thread pool
-        loop = asyncio.get_event_loop()
-        audio_path = await loop.run_in_executor(
-            None,
-            murf_tts.text_to_speech,
+        # Murf call and download run on the event loop over the shared async client
+        audio_path = await murf_tts.text_to_speech_async(
             request.text,
             request.voice_id,
             request.style,
             request.speed
         )
         
-        if audio_path and os.path.exists(audio_path):
+        # text_to_speech only returns a path once the file has been written
+        if audio_path:
             # Return relative path for frontend
             filename = os.path.basename(audio_path)
             audio_url = f"/audio/{filename}"
@@ -268,15 +441,63 @@ async def convert_to_speech(request: TTSRequest):
             
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"TTS error: {str(e)}")
+    finally:
+        tts_slots.release()
 
-@app.get("/voices")
-async def get_available_voices():
-    """Get available voices"""
-    if not murf_tts:
-        raise HTTPException(status_code=503, detail="Murf TTS service not available")
+@app.get("/murf/stream")
+async def stream_speech(http_request: Request, text: str, voice_id: Optional[str] = None,
+                  style: Optional[str] = None, speed: float = 1.0,
+                  murf_tts: MurfTTS = Depends(get_murf)):
+    """Convert text to speech and return the audio body directly"""
+    # Already generated: serve the file, which honours Range headers for seeking
+    audio_path = await asyncio.to_thread(murf_tts.cached_audio_path, text, voice_id)
+    if audio_path:
+        return FileResponse(
+            audio_path,
+            media_type="audio/mpeg",
+            headers={"Accept-Ranges": "bytes"}
+        )
+    
+    tts_slots = http_request.app.state.tts_slots
+    _tts_slot_free(tts_slots)
+    await tts_slots.acquire()
+    
+    try:
+        if murf_tts.async_murf_client:
+            chunks = await murf_tts.text_to_speech_stream(text, voice_id, style, speed)
+        else:
+            chunks = None
+            audio_path = await murf_tts.text_to_speech_async(text, voice_id, style, speed)
+    except Exception as e:
+        tts_slots.release()
+        raise HTTPException(status_code=500, detail=f"TTS error: {str(e)}")
+    
+    # Fresh conversion: forward the audio as it arrives from Murf (it is cached
+    # on the way); the slot stays taken until the stream is done
+    if chunks is not None:
+        body = _release_after_stream(chunks, tts_slots)
+        await body.__anext__()
+        return StreamingResponse(body, media_type="audio/mpeg")
+    
+    tts_slots.release()
+    
+    if not audio_path:
+        raise HTTPException(status_code=500, detail="Text-to-speech conversion failed")
     
+    return FileResponse(
+        audio_path,
+        media_type="audio/mpeg",
+        headers={"Accept-Ranges": "bytes"}
+    )
+
+@app.get("/voices", response_model_exclude_none=True)
+async def get_available_voices(response: Response, murf_tts: MurfTTS = Depends(get_murf)) -> APIResponse:
+    """Get available voices"""
     try:
         voices = murf_tts.get_available_voices()
+        # The fallback catalog is only a stand-in until Murf is back, so it isn't cached
+        if voices and murf_tts.use_murf:
+            response.headers["Cache-Control"] = f"public, max-age={VOICES_MAX_AGE}"
         return APIResponse(
             success=True,
             data=voices,
@@ -285,30 +506,30 @@ async def get_available_voices():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting voices: {str(e)}")
 
-@app.delete("/audio/{filename}")
-async def delete_audio_file(filename: str):
+@app.delete("/audio/{filename}", response_model_exclude_none=True)
+async def delete_audio_file(filename: str) -> APIResponse:
     """Delete a specific audio file"""
+    if not _AUDIO_NAME_RE.fullmatch(filename):
+        raise HTTPException(status_code=404, detail="Audio file not found")
+    
     try:
-        file_path = os.path.join(audio_dir, filename)
-        if os.path.exists(file_path) and filename.startswith("ava_speech_"):
-            os.remove(file_path)
-            return APIResponse(
-                success=True,
-                message=f"Audio file {filename} deleted"
-            )
-        else:
-            raise HTTPException(status_code=404, detail="Audio file not found")
+        await asyncio.to_thread(os.remove, os.path.join(audio_dir, filename))
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Audio file not found")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error deleting file: {str(e)}")
+    
+    return APIResponse(
+        success=True,
+        message=f"Audio file {filename} deleted"
+    )
 
-@app.post("/cleanup")
-async def cleanup_audio_files():
+@app.post("/cleanup", response_model_exclude_none=True)
+async def cleanup_audio_files(murf_tts: MurfTTS = Depends(get_murf)) -> APIResponse:
     """Clean up old audio files"""
-    if not murf_tts:
-        raise HTTPException(status_code=503, detail="Murf TTS service not available")
-    
     try:
-        murf_tts.cleanup_audio_files(max_files=10)
+        # Directory scan and deletions are blocking I/O, keep them off the event loop
+        await asyncio.to_thread(murf_tts.cleanup_audio_files, 10)
         return APIResponse(
             success=True,
             message="Audio files cleaned up"
@@ -316,14 +537,12 @@ async def cleanup_audio_files():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error cleaning up files: {str(e)}")
 
-@app.post("/stop-audio")
-async def stop_audio_playback():
+@app.post("/stop-audio", response_model_exclude_none=True)
+async def stop_audio_playback(murf_tts: MurfTTS = Depends(get_murf)) -> APIResponse:
     """Stop current audio playback"""
-    if not murf_tts:
-        raise HTTPException(status_code=503, detail="Murf TTS service not available")
-    
     try:
-        murf_tts.stop_audio()
+        # Stopping may wait on the player threads or the speech process
+        await asyncio.to_thread(murf_tts.stop_audio)
         return APIResponse(
             success=True,
             message="Audio playback stopped"
@@ -331,6 +550,10 @@ async def stop_audio_playback():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error stopping audio: {str(e)}")
 
+# Mounted after the API routes so DELETE /audio/{filename} isn't shadowed by the static files
+# (the directory is created in `lifespan`, so don't require it at import time)
+app.mount("/audio", AudioFiles(directory=audio_dir, check_dir=False), name="audio")
+
 # Error handlers
 @app.exception_handler(404)
 async def not_found_handler(request, exc):
@@ -348,45 +571,70 @@ async def internal_error_handler(request, exc):
 
 import socket
 
-def find_free_port(start_port: int = 8000) -> int:
-    """Find a free port starting from the given port"""
-    for port in range(start_port, start_port + 10):
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            try:
-                s.bind(('127.0.0.1', port))
-                return port
-            except OSError:
-                continue
-    raise RuntimeError(f"No free port found in range {start_port} to {start_port + 9}")
-
-def run_api_server(host: str = "127.0.0.1", port: int = 8000):
+# A single worker: the conversation, reply cache, microphone and audio playback
+# all live in the process, so extra workers would each hold their own copy
+DEFAULT_WORKERS = 1
+
+# Seconds in-flight Gemini/TTS requests get to finish on shutdown before
+# connections are closed
+GRACEFUL_SHUTDOWN_TIMEOUT = 30
+
+def find_free_port(preferred: int = 8000, host: str = "127.0.0.1") -> int:
+    """Return the preferred port if it is free, otherwise a kernel-assigned free port"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        # Bind the way uvicorn will, so a port left in TIME_WAIT by the last run
+        # still counts as free (on Windows this flag would allow stealing a port
+        # that is in use, so leave it off there)
+        if not sys.platform.startswith('win'):
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            s.bind((host, preferred))
+            return preferred
+        except OSError:
+            s.bind((host, 0))
+            return s.getsockname()[1]
+
+def run_api_server(host: str = "127.0.0.1", port: int = 8000, workers: int = DEFAULT_WORKERS):
     """Run the FastAPI server"""
     # Find a free port
     try:
-        free_port = find_free_port(port)
+        free_port = find_free_port(port, host)
         if free_port != port:
             print(f"Port {port} not available, using port {free_port}")
         port = free_port
-    except RuntimeError as e:
+    except OSError as e:
         print(f"ERROR: {e}")
         return
     
-    print(f"Starting Ava AI API server on http://{host}:{port}")
+    print(f"Starting Ava AI API server on http://{host}:{port} ({workers} worker(s))")
     print("Endpoints available:")
     print(f"   - GET  http://{host}:{port}/")
     print(f"   - GET  http://{host}:{port}/status")
     print(f"   - POST http://{host}:{port}/voice")
     print(f"   - POST http://{host}:{port}/gemini")
+    print(f"   - POST http://{host}:{port}/gemini/stream")
     print(f"   - POST http://{host}:{port}/murf")
+    print(f"   - GET  http://{host}:{port}/murf/stream?text=...")
     print(f"   - GET  http://{host}:{port}/voices")
     print(f"   - GET  http://{host}:{port}/audio/{{filename}}")
     print(f"   - POST http://{host}:{port}/cleanup")
     print(f"   - POST http://{host}:{port}/stop-audio")
     
+    # Workers are separate processes, so uvicorn needs an import string; each
+    # worker builds its own services in `lifespan` and shares the audio folder.
+    # A single worker serves this module's app directly, so running this file
+    # doesn't import it a second time as `api_main`
     uvicorn.run(
-        app, 
+        app if workers == 1 else "api_main:app",
+        app_dir=str(project_root),
         host=host, 
         port=port, 
+        workers=workers,
+        # uvloop event loop and httptools parser when installed (uvicorn[standard];
+        # uvloop is skipped on Windows), stock asyncio/h11 otherwise
+        loop="auto",
+        http="auto",
+        timeout_graceful_shutdown=GRACEFUL_SHUTDOWN_TIMEOUT,
         log_level="info",
         access_log=True
     )
@@ -397,11 +645,15 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Ava AI Voice Assistant API Server")
     parser.add_argument("--host", default="127.0.0.1", help="Host to bind to")
     parser.add_argument("--port", type=int, default=8000, help="Port to bind to")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help="Number of worker processes (default 1). Each worker has its own "
+                             "conversation, microphone and audio player, so consecutive requests "
+                             "may not share context and /stop-audio only reaches one worker")
     
     args = parser.parse_args()
     
     try:
-        run_api_server(args.host, args.port)
+        run_api_server(args.host, args.port, args.workers)
     except KeyboardInterrupt:
         print("\nAPI server stopped by user")
     except Exception as e:
@@ -5,8 +5,12 @@ Uses pyttsx3 (offline TTS) as fallback when Murf API is not available
 
 import os
 import time
+import queue
+import asyncio
+import itertools
 import threading
-from typing import Optional, Callable
+import multiprocessing
+from typing import Optional, Callable, Dict, Tuple
 
 try:
     import pyttsx3
@@ -15,38 +19,168 @@ except ImportError:
     PYTTSX3_AVAILABLE = False
     print("pyttsx3 not available - install with: pip install pyttsx3")
 
-from audioplayer import AudioPlayer
+# Seconds to wait for the speech process to bring up its engine
+ENGINE_START_TIMEOUT = 15
+
+
+def _speech_process(requests_q, done_q, stop_generation):
+    """
+    Speech worker process: owns the pyttsx3 engine (and its COM apartment on
+    Windows) and speaks queued utterances one at a time
+    
+    Args:
+        requests_q: Queue of (request_id, generation, text, output_path) items,
+            None to exit; with an output_path the speech is saved to that file
+            instead of spoken
+        done_q: Queue receiving the engine status, then each finished request_id
+        stop_generation: Shared counter bumped by stop_audio; requests from an
+            older generation are cut short or skipped
+    """
+    try:
+        engine = pyttsx3.init()
+        # Set properties
+        voices = engine.getProperty('voices')
+        if voices:
+            # Prefer female voice if available
+            for voice in voices:
+                if 'female' in voice.name.lower() or 'zira' in voice.name.lower():
+                    engine.setProperty('voice', voice.id)
+                    break
+        
+        # Set speech rate
+        engine.setProperty('rate', 180)  # Speed of speech
+        engine.setProperty('volume', 0.9)  # Volume level (0.0 to 1.0)
+        
+        # runAndWait can only be interrupted from the engine's own callbacks,
+        # so check for a stop at every word
+        current = [0]
+        
+        def on_word(name, location, length):
+            if stop_generation.value > current[0]:
+                engine.stop()
+        
+        engine.connect('started-word', on_word)
+    except Exception as e:
+        done_q.put(f"❌ Error initializing pyttsx3: {e}")
+        return
+    
+    done_q.put(True)
+    
+    while True:
+        item = requests_q.get()
+        if item is None:
+            break
+        
+        request_id, generation, text, output_path = item
+        if generation < stop_generation.value:
+            # Dropped by stop_audio while still queued
+            done_q.put(request_id)
+            continue
+        
+        current[0] = generation
+        try:
+            if output_path:
+                engine.save_to_file(text, output_path)
+                engine.runAndWait()
+            else:
+                print(f"🗣️  Speaking: {text[:50]}{'...' if len(text) > 50 else ''}")
+                engine.say(text)
+                engine.runAndWait()
+                print("✅ Speech completed")
+        except Exception as e:
+            print(f"❌ Error during speech: {e}")
+        
+        done_q.put(request_id)
 
 
 class FallbackTTS:
     def __init__(self):
         self.is_playing = False
-        self.current_player = None
         
-        # Initialize pyttsx3 if available
-        if PYTTSX3_AVAILABLE:
+        # Requests queued in the speech process, by request id:
+        # (callback, whether the request is spoken aloud)
+        self._pending: Dict[int, Tuple[Optional[Callable], bool]] = {}
+        self._pending_lock = threading.Lock()
+        self._request_ids = itertools.count()
+        
+        # Set once the speech process has reported whether its engine came up
+        self._engine_checked = threading.Event()
+        
+        # Initialize pyttsx3 if available, in its own process so the engine
+        # never contends with the caller's threads; it starts in the background
+        # and requests queue up until the engine is ready. The process lives
+        # as long as this object: stopping speech signals it instead of
+        # replacing it, since starting a process re-imports the main module
+        self.tts_available = PYTTSX3_AVAILABLE and self._start_process()
+        if not self.tts_available:
+            self._engine_checked.set()
+
+    def _start_process(self) -> bool:
+        """
+        Spawn the speech process without waiting for its engine
+        
+        Returns:
+            True if the process was started, False otherwise
+        """
+        ctx = multiprocessing.get_context("spawn")
+        self._requests_q = ctx.Queue()
+        self._done_q = ctx.Queue()
+        self._stop_generation = ctx.Value('i', 0)
+        self._process = ctx.Process(
+            target=_speech_process,
+            args=(self._requests_q, self._done_q, self._stop_generation),
+            daemon=True
+        )
+        
+        try:
+            self._process.start()
+        except Exception as e:
+            print(f"❌ Error starting speech process: {e}")
+            return False
+        
+        # Resolve callbacks as the process reports finished utterances
+        threading.Thread(target=self._completion_reader, daemon=True).start()
+        return True
+
+    def _completion_reader(self):
+        """Wait for the speech engine, then run callbacks for finished utterances"""
+        try:
+            status = self._done_q.get(timeout=ENGINE_START_TIMEOUT)
+        except queue.Empty:
+            status = "❌ Speech engine did not start in time"
+        
+        if status is not True:
+            print(status)
+            if self._process.is_alive():
+                self._process.kill()
+            self.tts_available = False
+            self._engine_checked.set()
+            with self._pending_lock:
+                failed = list(self._pending)
+            for request_id in failed:
+                self._finish(request_id)
+            return
+        
+        print("✅ Fallback TTS (pyttsx3) initialized successfully")
+        self._engine_checked.set()
+        
+        while True:
+            request_id = self._done_q.get()
+            if request_id is None:
+                break
+            self._finish(request_id)
+
+    def _finish(self, request_id: int):
+        """Mark an utterance as done and run its callback"""
+        with self._pending_lock:
+            callback, _ = self._pending.pop(request_id, (None, False))
+            self.is_playing = any(spoken for _, spoken in self._pending.values())
+        
+        if callback:
             try:
-                self.engine = pyttsx3.init()
-                # Set properties
-                voices = self.engine.getProperty('voices')
-                if voices:
-                    # Prefer female voice if available
-                    for voice in voices:
-                        if 'female' in voice.name.lower() or 'zira' in voice.name.lower():
-                            self.engine.setProperty('voice', voice.id)
-                            break
-                
-                # Set speech rate
-                self.engine.setProperty('rate', 180)  # Speed of speech
-                self.engine.setProperty('volume', 0.9)  # Volume level (0.0 to 1.0)
-                
-                self.tts_available = True
-                print("✅ Fallback TTS (pyttsx3) initialized successfully")
+                callback()
             except Exception as e:
-                print(f"❌ Error initializing pyttsx3: {e}")
-                self.tts_available = False
-        else:
-            self.tts_available = False
+                print(f"❌ Error in speech callback: {e}")
 
     def speak_text(self, text: str, callback: Optional[Callable] = None):
         """
@@ -62,42 +196,74 @@ class FallbackTTS:
                 callback()
             return
         
-        def speak_thread():
-            try:
-                self.is_playing = True
-                print(f"🗣️  Speaking: {text[:50]}{'...' if len(text) > 50 else ''}")
-                
-                self.engine.say(text)
-                self.engine.runAndWait()
-                
-                self.is_playing = False
-                print("✅ Speech completed")
-                
-                if callback:
-                    callback()
-                    
-            except Exception as e:
-                print(f"❌ Error during speech: {e}")
-                self.is_playing = False
-                if callback:
-                    callback()
+        self._submit(text, callback)
+
+    def synthesize_to_file(self, text: str, output_path: str, timeout: float = 30) -> Optional[str]:
+        """
+        Render text to an audio file instead of speaking it (blocks until done)
         
-        # Run in separate thread
-        speech_thread = threading.Thread(target=speak_thread, daemon=True)
-        speech_thread.start()
+        Args:
+            text: Text to synthesize
+            output_path: Destination audio file (WAV)
+            timeout: Maximum seconds to wait for the speech process
+            
+        Returns:
+            Path to the audio file or None if synthesis failed
+        """
+        if not self.tts_available:
+            return None
+        
+        done = threading.Event()
+        self._submit(text, done.set, output_path)
+        if not done.wait(timeout) or not os.path.exists(output_path):
+            return None
+        return output_path
+
+    def _submit(self, text: str, callback: Optional[Callable], output_path: Optional[str] = None):
+        """Queue a request for the speech process"""
+        request_id = next(self._request_ids)
+        with self._pending_lock:
+            self._pending[request_id] = (callback, output_path is None)
+            self.is_playing = self.is_playing or output_path is None
+        self._requests_q.put((request_id, self._stop_generation.value, text, output_path))
+
+    async def speak_async(self, text: str):
+        """
+        Speak text and wait for it to finish without blocking the event loop
+        
+        Args:
+            text: Text to speak
+        """
+        loop = asyncio.get_running_loop()
+        done = loop.create_future()
+        
+        def finished():
+            loop.call_soon_threadsafe(lambda: done.done() or done.set_result(None))
+        
+        self.speak_text(text, finished)
+        await done
 
     def stop_audio(self):
         """Stop current speech"""
         if self.tts_available and self.is_playing:
             try:
-                self.engine.stop()
-                self.is_playing = False
+                # The speech process cuts the current utterance short at its
+                # next word and skips everything queued before the stop
+                with self._pending_lock:
+                    with self._stop_generation.get_lock():
+                        self._stop_generation.value += 1
+                    stopped = list(self._pending)
+                
+                for request_id in stopped:
+                    self._finish(request_id)
+                
                 print("🔇 Speech stopped")
             except Exception as e:
                 print(f"Error stopping speech: {e}")
 
     def test_connection(self) -> bool:
-        """Test if TTS is working"""
+        """Test if TTS is working (waits for the speech engine to start)"""
+        self._engine_checked.wait(ENGINE_START_TIMEOUT)
         return self.tts_available
 
 
@@ -6,12 +6,40 @@ Handles conversation with Google's Gemini AI
 import google.generativeai as genai
 from dotenv import load_dotenv
 import os
-from typing import Optional, List, Dict
+from typing import Optional, Deque, Dict, Tuple, AsyncIterator
+from collections import deque, OrderedDict
+import asyncio
+import hashlib
+import random
+import threading
 import time
 
 # Load environment variables
 load_dotenv()
 
+# Conversation messages kept for context (20 exchanges)
+MAX_HISTORY_MESSAGES = 40
+
+# Seconds to wait for a single Gemini request before retrying
+REQUEST_TIMEOUT = 15
+
+# Upper bound for the retry backoff delay in seconds
+MAX_BACKOFF = 8
+
+# Replies remembered for an identical message following the same recent
+# turns (e.g. the same opening greeting), and for how long
+RESPONSE_CACHE_SIZE = 256
+RESPONSE_CACHE_TTL = 300
+
+# Trailing history messages (the last exchange) a cached reply must share;
+# keying on the whole conversation would never repeat in a long-lived server
+RESPONSE_CACHE_CONTEXT = 2
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with jitter so concurrent retries don't line up"""
+    return min(2 ** attempt + random.uniform(0, 0.5), MAX_BACKOFF)
+
 
 class GeminiResponse:
     def __init__(self):
@@ -23,11 +51,9 @@ class GeminiResponse:
         # Configure the Gemini API
         genai.configure(api_key=self.api_key)
         
-        # Initialize the model
-        self.model = genai.GenerativeModel('gemini-1.5-flash')
-        
-        # Initialize conversation history
-        self.conversation_history: List[Dict[str, str]] = []
+        # Conversation turns (last 20 exchanges); the system prompt is kept
+        # on the model, so old turns simply fall off the front
+        self.conversation_history: Deque[Dict[str, str]] = deque(maxlen=MAX_HISTORY_MESSAGES)
         
         # Set personality for Ava
         self.system_prompt = """You are Ava, a friendly and helpful AI voice assistant. 
@@ -42,11 +68,23 @@ class GeminiResponse:
         Since this is a voice conversation, avoid using formatting like bullet points, 
         numbered lists, or special characters unless absolutely necessary."""
         
-        # Add system prompt to conversation history
-        self.conversation_history.append({
-            "role": "system", 
-            "content": self.system_prompt
-        })
+        # Initialize the model with the personality as a persistent system
+        # instruction, and a chat session that tracks the turns for us
+        self.model = genai.GenerativeModel('gemini-1.5-flash', system_instruction=self.system_prompt)
+        self.chat = self.model.start_chat(history=[])
+        
+        # Timestamp of the last successful connection test
+        self._last_connection_ok: Optional[float] = None
+        
+        # The chat session records one turn per send, so turns in this
+        # conversation run one at a time: a thread lock for get_response (desktop
+        # UI) and an asyncio lock for the async methods (API), created on first
+        # async use inside the event loop
+        self._turn_lock = threading.Lock()
+        self._async_turn_lock: Optional[asyncio.Lock] = None
+        
+        # Recent replies: conversation + message hash -> (reply, expiry timestamp)
+        self._response_cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
 
     def get_response(self, user_input: str, max_retries: int = 3) -> Optional[str]:
         """
@@ -59,39 +97,44 @@ class GeminiResponse:
         Returns:
             AI response text or None if failed
         """
+        with self._turn_lock:
+            return self._get_response(user_input, max_retries)
+
+    def _get_response(self, user_input: str, max_retries: int) -> Optional[str]:
+        """get_response body; the caller holds the turn lock"""
         if not user_input or not user_input.strip():
             return "I didn't catch that. Could you please repeat?"
         
-        # Add user input to conversation history
-        self.conversation_history.append({
-            "role": "user",
-            "content": user_input.strip()
-        })
+        user_input = user_input.strip()
+        
+        # Same message at the same point in the conversation: reuse the reply
+        cache_key = self._response_cache_key(user_input)
+        cached_response = self._cached_response(cache_key)
+        if cached_response:
+            self._record_cached_turn(user_input, cached_response)
+            return cached_response
         
-        # Prepare the full conversation context
-        conversation_text = self._build_conversation_context()
+        # Add user input to conversation history
+        self._append_message("user", user_input)
         
         for attempt in range(max_retries):
             try:
                 print(f"Sending to Gemini (attempt {attempt + 1})...")
                 
-                # Generate response
-                response = self.model.generate_content(conversation_text)
+                # Send only the new turn; the chat session carries the history
+                response = self.chat.send_message(user_input)
                 
                 if response.text:
                     ai_response = response.text.strip()
                     
                     # Add AI response to conversation history
-                    self.conversation_history.append({
-                        "role": "assistant",
-                        "content": ai_response
-                    })
+                    self._append_message("assistant", ai_response)
                     
-                    # Keep conversation history manageable (last 20 exchanges)
-                    if len(self.conversation_history) > 41:  # 1 system + 20 exchanges
-                        # Keep system prompt + last 20 exchanges
-                        self.conversation_history = [self.conversation_history[0]] + self.conversation_history[-40:]
+                    # Keep the chat session in step with the bounded history
+                    if len(self.chat.history) > MAX_HISTORY_MESSAGES:
+                        self.chat.history = self.chat.history[-MAX_HISTORY_MESSAGES:]
                     
+                    self._store_response(cache_key, ai_response)
                     print(f"Gemini response: {ai_response}")
                     return ai_response
                 else:
@@ -104,47 +147,226 @@ class GeminiResponse:
                 print(f"Error getting Gemini response (attempt {attempt + 1}): {e}")
                 
                 if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
+                    time.sleep(_backoff_delay(attempt))
                     continue
         
         # If all attempts failed, return a fallback response
         fallback_response = "I'm having trouble connecting right now. Could you try asking again?"
         
-        self.conversation_history.append({
-            "role": "assistant",
-            "content": fallback_response
-        })
+        self._append_message("assistant", fallback_response)
         
         return fallback_response
 
-    def _build_conversation_context(self) -> str:
+    async def get_response_async(self, user_input: str, max_retries: int = 3) -> Optional[str]:
         """
-        Build conversation context for Gemini
+        Get response from Gemini AI without blocking the event loop
         
+        Args:
+            user_input: User's message/question
+            max_retries: Maximum number of retry attempts
+            
         Returns:
-            Formatted conversation string
+            AI response text or None if failed
+        """
+        async with self._get_async_turn_lock():
+            return await self._get_response_async(user_input, max_retries)
+
+    async def _get_response_async(self, user_input: str, max_retries: int) -> Optional[str]:
+        """get_response_async body; the caller holds the async turn lock"""
+        if not user_input or not user_input.strip():
+            return "I didn't catch that. Could you please repeat?"
+        
+        user_input = user_input.strip()
+        
+        # Same message at the same point in the conversation: reuse the reply
+        cache_key = self._response_cache_key(user_input)
+        cached_response = self._cached_response(cache_key)
+        if cached_response:
+            self._record_cached_turn(user_input, cached_response)
+            return cached_response
+        
+        # Add user input to conversation history
+        self._append_message("user", user_input)
+        
+        for attempt in range(max_retries):
+            try:
+                print(f"Sending to Gemini (attempt {attempt + 1})...")
+                
+                # Generate response using the SDK's async client
+                response = await asyncio.wait_for(
+                    self.chat.send_message_async(user_input),
+                    timeout=REQUEST_TIMEOUT
+                )
+                
+                if response.text:
+                    ai_response = response.text.strip()
+                    
+                    # Add AI response to conversation history
+                    self._append_message("assistant", ai_response)
+                    
+                    # Keep the chat session in step with the bounded history
+                    if len(self.chat.history) > MAX_HISTORY_MESSAGES:
+                        self.chat.history = self.chat.history[-MAX_HISTORY_MESSAGES:]
+                    
+                    self._store_response(cache_key, ai_response)
+                    print(f"Gemini response: {ai_response}")
+                    return ai_response
+                else:
+                    print("Empty response from Gemini")
+                    if attempt < max_retries - 1:
+                        await asyncio.sleep(1)
+                        continue
+                        
+            except Exception as e:
+                print(f"Error getting Gemini response (attempt {attempt + 1}): {e}")
+                
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(_backoff_delay(attempt))
+                    continue
+        
+        # If all attempts failed, return a fallback response
+        fallback_response = "I'm having trouble connecting right now. Could you try asking again?"
+        
+        self._append_message("assistant", fallback_response)
+        
+        return fallback_response
+
+    async def get_response_stream(self, user_input: str) -> AsyncIterator[str]:
         """
-        context_parts = []
+        Stream the response from Gemini as it is generated
         
-        for message in self.conversation_history:
-            role = message["role"]
-            content = message["content"]
+        Args:
+            user_input: User's message/question
             
-            if role == "system":
-                context_parts.append(f"System: {content}")
-            elif role == "user":
-                context_parts.append(f"User: {content}")
-            elif role == "assistant":
-                context_parts.append(f"Ava: {content}")
+        Yields:
+            Pieces of the AI response text
+        """
+        # The turn lock is held until the stream is finished or abandoned
+        async with self._get_async_turn_lock():
+            stream = self._get_response_stream(user_input)
+            try:
+                async for text in stream:
+                    yield text
+            finally:
+                # Settle the chat session before the next turn may start
+                await stream.aclose()
+
+    async def _get_response_stream(self, user_input: str) -> AsyncIterator[str]:
+        """get_response_stream body; the caller holds the async turn lock"""
+        if not user_input or not user_input.strip():
+            yield "I didn't catch that. Could you please repeat?"
+            return
         
-        return "\n\n".join(context_parts) + "\n\nAva:"
+        user_input = user_input.strip()
+        
+        # Same message at the same point in the conversation: reuse the reply
+        cache_key = self._response_cache_key(user_input)
+        cached_response = self._cached_response(cache_key)
+        if cached_response:
+            self._record_cached_turn(user_input, cached_response)
+            yield cached_response
+            return
+        
+        self._append_message("user", user_input)
+        
+        # A stream that breaks off leaves the chat session unusable, so keep
+        # the turns it had before
+        chat_history = list(self.chat.history)
+        chunks = []
+        complete = False
+        try:
+            print("Streaming from Gemini...")
+            response = await asyncio.wait_for(
+                self.chat.send_message_async(user_input, stream=True),
+                timeout=REQUEST_TIMEOUT
+            )
+            async for chunk in response:
+                if chunk.text:
+                    chunks.append(chunk.text)
+                    yield chunk.text
+            complete = True
+            
+        except Exception as e:
+            print(f"Error streaming Gemini response: {e}")
+            
+        finally:
+            # Also runs when the consumer goes away mid-stream
+            ai_response = "".join(chunks).strip()
+            if not complete:
+                if ai_response:
+                    # Keep what was already delivered as the model's turn
+                    self.chat.history = [*chat_history, {"role": "user", "parts": [user_input]}, {"role": "model", "parts": [ai_response]}]
+                else:
+                    self.chat.history = chat_history
+            if ai_response:
+                self._append_message("assistant", ai_response)
+                
+                # Keep the chat session in step with the bounded history
+                if len(self.chat.history) > MAX_HISTORY_MESSAGES:
+                    self.chat.history = self.chat.history[-MAX_HISTORY_MESSAGES:]
+                
+                if complete:
+                    self._store_response(cache_key, ai_response)
+                print(f"Gemini response: {ai_response}")
+        
+        if not ai_response:
+            fallback_response = "I'm having trouble connecting right now. Could you try asking again?"
+            self._append_message("assistant", fallback_response)
+            yield fallback_response
+
+    def _get_async_turn_lock(self) -> asyncio.Lock:
+        """Lock serializing async turns, created inside the running event loop"""
+        if self._async_turn_lock is None:
+            self._async_turn_lock = asyncio.Lock()
+        return self._async_turn_lock
+
+    def _append_message(self, role: str, content: str):
+        """Append a message to the conversation history"""
+        self.conversation_history.append({"role": role, "content": content})
+
+    def _response_cache_key(self, user_input: str) -> str:
+        """Hash of the last exchange plus the new message"""
+        digest = hashlib.sha1()
+        recent = list(self.conversation_history)[-RESPONSE_CACHE_CONTEXT:]
+        for message in recent:
+            digest.update(f"{message['role']}\0{message['content']}\0".encode("utf-8"))
+        digest.update(user_input.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _cached_response(self, cache_key: str) -> Optional[str]:
+        """Return a cached reply that hasn't expired"""
+        cached = self._response_cache.get(cache_key)
+        if not cached:
+            return None
+        if cached[1] <= time.monotonic():
+            del self._response_cache[cache_key]
+            return None
+        self._response_cache.move_to_end(cache_key)
+        return cached[0]
+
+    def _store_response(self, cache_key: str, response: str):
+        """Cache a reply, evicting the least recently used beyond the size limit"""
+        self._response_cache[cache_key] = (response, time.monotonic() + RESPONSE_CACHE_TTL)
+        self._response_cache.move_to_end(cache_key)
+        while len(self._response_cache) > RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+
+    def _record_cached_turn(self, user_input: str, response: str):
+        """Add a turn answered from the cache to both histories"""
+        self._append_message("user", user_input)
+        self._append_message("assistant", response)
+        
+        # The chat session must see the turn too, or Gemini loses the context
+        history = [*self.chat.history, {"role": "user", "parts": [user_input]}, {"role": "model", "parts": [response]}]
+        self.chat.history = history[-MAX_HISTORY_MESSAGES:]
+        print(f"Gemini response (cached): {response}")
 
     def reset_conversation(self):
         """Reset the conversation history"""
-        self.conversation_history = [{
-            "role": "system",
-            "content": self.system_prompt
-        }]
+        # Wait for a turn in progress, so it can't land in the new chat session
+        with self._turn_lock:
+            self.conversation_history.clear()
+            self.chat = self.model.start_chat(history=[])
         print("Conversation history reset!")
 
     def get_conversation_summary(self) -> str:
@@ -154,7 +376,7 @@ class GeminiResponse:
         Returns:
             Summary of conversation history
         """
-        if len(self.conversation_history) <= 1:  # Only system prompt
+        if not self.conversation_history:
             return "No conversation yet."
         
         user_messages = len([msg for msg in self.conversation_history if msg["role"] == "user"])
@@ -162,16 +384,25 @@ class GeminiResponse:
         
         return f"Conversation: {user_messages} user messages, {ai_messages} AI responses"
 
-    def test_connection(self) -> bool:
+    def test_connection(self, max_age: float = 60) -> bool:
         """
         Test the connection to Gemini API
         
+        Args:
+            max_age: Reuse a successful test result younger than this many seconds
+            
         Returns:
             True if connection successful, False otherwise
         """
+        if self._last_connection_ok is not None and time.monotonic() - self._last_connection_ok < max_age:
+            return True
+        
         try:
             test_response = self.model.generate_content("Hello! Please respond with just 'Hello back!' to test the connection.")
-            return test_response.text is not None
+            if test_response.text is None:
+                return False
+            self._last_connection_ok = time.monotonic()
+            return True
         except Exception as e:
             print(f"Gemini connection test failed: {e}")
             return False
@@ -5,19 +5,26 @@ Handles voice synthesis using Murf AI Official SDK
 
 import os
 import time
-from typing import Optional, Callable
+import shutil
+import logging
+import contextlib
+from typing import Optional, Callable, List, BinaryIO, Iterator, AsyncIterator, Awaitable, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from dotenv import load_dotenv
 import threading
+import queue
+import asyncio
+import itertools
+import functools
+import hashlib
+import heapq
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import base64
 
-# Try to import Murf SDK
-try:
-    from murf import Murf
-    MURF_SDK_AVAILABLE = True
-except ImportError:
-    MURF_SDK_AVAILABLE = False
-    print("⚠️  Murf SDK not available. Install with: pip install murf")
+if TYPE_CHECKING:
+    import httpx
 
 # Try to import fallback TTS
 try:
@@ -26,46 +33,162 @@ try:
 except ImportError:
     FALLBACK_AVAILABLE = False
 
-# For audio playback
-from audioplayer import AudioPlayer
-
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Chunk size used when streaming downloaded audio to disk
+AUDIO_CHUNK_SIZE = 64 * 1024
+
+# Write buffer for audio files, so a download lands in a few large writes
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Generated audio is cached on disk as ava_cache_<key>.mp3, keyed by its inputs
+CACHE_PREFIX = "ava_cache_"
+MAX_CACHED_AUDIO = 200
+
+# Output settings sent to Murf (part of the cache key)
+AUDIO_FORMAT = "MP3"
+AUDIO_SAMPLE_RATE = 44100
+AUDIO_CHANNELS = "STEREO"
+
+# Unique suffixes for temporary audio files
+_tmp_ids = itertools.count()
+
+
+@contextlib.contextmanager
+def _atomic_write(filepath: str) -> Iterator[BinaryIO]:
+    """
+    Open a temporary file next to `filepath` and move it into place once
+    fully written, so readers never see a partial file and concurrent writers
+    (threads or coroutines) of the same cached audio don't interleave.
+    No fsync: audio can be regenerated.
+    """
+    tmp_path = f"{filepath}.{os.getpid()}.{next(_tmp_ids)}.tmp"
+    try:
+        with open(tmp_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            yield f
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+@contextlib.asynccontextmanager
+async def _atomic_write_async(filepath: str) -> AsyncIterator[Callable[[bytes], Awaitable[int]]]:
+    """
+    _atomic_write for coroutines: yields an async write function, and the
+    open, each write and the final move run on worker threads. An abandoned
+    or failed write removes the temporary file.
+    """
+    writer = _atomic_write(filepath)
+    f = await asyncio.to_thread(writer.__enter__)
+    try:
+        yield functools.partial(asyncio.to_thread, f.write)
+    except BaseException as e:
+        await asyncio.to_thread(writer.__exit__, type(e), e, e.__traceback__)
+        raise
+    await asyncio.to_thread(writer.__exit__, None, None, None)
+
+
+def _import_murf():
+    """
+    Import the Murf SDK on first use so processes that never call Murf
+    don't pay for loading it
+    
+    Returns:
+        The murf module or None if the SDK is not installed
+    """
+    try:
+        import murf
+        return murf
+    except ImportError:
+        logger.warning("⚠️  Murf SDK not available. Install with: pip install murf")
+        return None
+
 
 class MurfTTS:
-    def __init__(self):
+    def __init__(self, http_client: Optional["httpx.Client"] = None,
+                 async_http_client: Optional["httpx.AsyncClient"] = None):
         self.api_key = os.getenv('MURF_API_KEY')
         
+        # Optional shared, connection-pooled HTTP client for Murf API calls and downloads
+        self.http_client = http_client
+        
+        # Optional shared async client; enables the non-blocking text_to_speech_async
+        self.async_http_client = async_http_client
+        
+        # Keep-alive session for audio downloads, only when no shared client is given
+        self._http: Optional[requests.Session] = None
+        if http_client is None:
+            self._http = requests.Session()
+            self._http.mount("https://", HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=10,
+                max_retries=Retry(total=2, backoff_factor=0.3)
+            ))
+        
         if not self.api_key:
-            print("⚠️  MURF_API_KEY not found - using fallback TTS")
+            logger.warning("⚠️  MURF_API_KEY not found - using fallback TTS")
         
         # Default voice settings - define before testing connection
         self.default_voice_id = "en-US-terrell"  # Using voice from documentation
         
         # Initialize Murf client if SDK is available
         self.murf_client = None
+        self.async_murf_client = None
         self.use_murf = False
         
-        if MURF_SDK_AVAILABLE and self.api_key:
+        # Set once a real conversion succeeds; until then a failure means Murf
+        # is unusable and we switch to the fallback
+        self._murf_verified = False
+        
+        # Murf failures since the last successful conversion
+        self._recent_murf_failures = 0
+        
+        murf = _import_murf() if self.api_key else None
+        if murf:
             try:
-                self.murf_client = Murf(api_key=self.api_key)
+                if self.http_client is not None:
+                    self.murf_client = murf.Murf(api_key=self.api_key, httpx_client=self.http_client)
+                else:
+                    self.murf_client = murf.Murf(api_key=self.api_key)
+                AsyncMurf = getattr(murf, "AsyncMurf", None)
+                if AsyncMurf and self.async_http_client is not None:
+                    self.async_murf_client = AsyncMurf(api_key=self.api_key, httpx_client=self.async_http_client)
                 self.use_murf = self._test_murf_connection()
                 if self.use_murf:
-                    print("✅ Murf SDK initialized successfully")
+                    logger.info("✅ Murf SDK initialized successfully")
                 else:
-                    print("⚠️  Murf SDK connection failed")
+                    logger.warning("⚠️  Murf SDK connection failed")
             except Exception as e:
-                print(f"⚠️  Error initializing Murf SDK: {e}")
+                logger.warning("⚠️  Error initializing Murf SDK: %s", e)
                 self.use_murf = False
         self.audio_folder = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "audio")
         
         # Ensure audio folder exists
         os.makedirs(self.audio_folder, exist_ok=True)
         
+        # Cached audio already on disk: cache key -> file path
+        self._cache_index: dict = self._scan_audio_cache()
+        
+        # Voice catalog, built on first request
+        self._voices_cache: Optional[dict] = None
+        
         # Audio player for playback
         self.current_player = None
         self.is_playing = False
+        self._stop_requested = threading.Event()
+        
+        # Playback requests are served in order by one long-lived player thread:
+        # (audio path, callback) items, where a None path only runs the callback
+        self._play_queue: "queue.Queue[tuple]" = queue.Queue()
+        self._player_thread = threading.Thread(target=self._player_loop, name="audio-player", daemon=True)
+        self._player_thread.start()
         
         # Initialize fallback TTS
         self.fallback_tts = None
@@ -74,25 +197,21 @@ class MurfTTS:
         if FALLBACK_AVAILABLE:
             try:
                 self.fallback_tts = FallbackTTS()
-                print("✅ Fallback TTS initialized")
+                logger.info("✅ Fallback TTS initialized")
             except Exception as e:
-                print(f"⚠️  Could not initialize fallback TTS: {e}")
+                logger.warning("⚠️  Could not initialize fallback TTS: %s", e)
+        
+        # After a Murf failure, optionally synthesize with both engines at once
+        # and play whichever finishes first (AVA_TTS_RACE=1)
+        self.race_fallback = os.getenv("AVA_TTS_RACE") == "1" and self.fallback_tts is not None
+        self._race_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tts-race") if self.race_fallback else None
     
     def _test_murf_connection(self) -> bool:
-        """Test if Murf SDK connection is working"""
-        if not self.murf_client:
-            return False
-        
-        try:
-            # Try a simple generation to test the connection
-            response = self.murf_client.text_to_speech.generate(
-                text="Test",
-                voice_id=self.default_voice_id
-            )
-            return hasattr(response, 'audio_file') or hasattr(response, 'encoded_audio')
-        except Exception as e:
-            print(f"Murf connection test failed: {e}")
-            return False
+        """
+        Check that Murf is configured; the first real conversion verifies it,
+        so no billable test generation is made at startup
+        """
+        return bool(self.api_key and self.murf_client)
 
     def get_available_voices(self) -> Optional[dict]:
         """
@@ -101,18 +220,20 @@ class MurfTTS:
         Returns:
             Dictionary with voice information or None if failed
         """
+        if self._voices_cache is not None:
+            return self._voices_cache
+        
         if self.use_murf and self.murf_client:
-            return {
+            self._voices_cache = {
                 "message": f"Murf SDK voices available (using {self.default_voice_id})",
                 "voices": [{"id": self.default_voice_id, "name": "Default Murf Voice"}]
             }
         elif self.fallback_tts:
-            return {
+            self._voices_cache = {
                 "message": "Fallback TTS (pyttsx3) voices available", 
                 "voices": [{"id": "fallback", "name": "System TTS"}]
             }
-        else:
-            return None
+        return self._voices_cache
 
     def text_to_speech(self, text: str, voice_id: Optional[str] = None, 
                       style: Optional[str] = None, speed: float = 1.0) -> Optional[str]:
@@ -136,56 +257,323 @@ class MurfTTS:
             return None  # Let the caller handle fallback
         
         voice_id = voice_id or self.default_voice_id
+        text = text.strip()
+        
+        # Identical phrases reuse the audio generated the first time
+        cache_key = self._cache_key(text, voice_id)
+        cached_path = self._cache_lookup(cache_key)
+        if cached_path:
+            logger.debug("Using cached audio: %s", cached_path)
+            return cached_path
         
         try:
-            print(f"Converting text to speech: '{text[:50]}{'...' if len(text) > 50 else ''}'")
+            logger.debug("Converting text to speech: '%.50s'", text)
             
             # Use Murf SDK to generate speech
             response = self.murf_client.text_to_speech.generate(
-                text=text.strip(),
+                text=text,
                 voice_id=voice_id,
-                format="MP3",
-                channel_type="STEREO",
-                sample_rate=44100
+                format=AUDIO_FORMAT,
+                channel_type=AUDIO_CHANNELS,
+                sample_rate=AUDIO_SAMPLE_RATE
             )
             
-            # Handle the response
-            audio_data = None
+            # Audio file for this conversion
+            filename = f"{CACHE_PREFIX}{cache_key}.mp3"
+            filepath = os.path.join(self.audio_folder, filename)
             
-            if hasattr(response, 'audio_file') and response.audio_file:
-                # Response contains a URL to download the audio
-                print(f"Downloading audio from: {response.audio_file}")
-                download_response = requests.get(response.audio_file, timeout=30)
-                download_response.raise_for_status()
-                audio_data = download_response.content
+            # Handle the response
+            audio_url = getattr(response, 'audio_file', None)
+            encoded = None if audio_url else getattr(response, 'encoded_audio', None)
+            if audio_url:
+                # Response contains a URL to download the audio; write it in chunks
+                # as it arrives
+                logger.debug("Downloading audio from: %s", audio_url)
+                with _atomic_write(filepath) as f:
+                    self._download_audio(audio_url, f)
                 
-            elif hasattr(response, 'encoded_audio') and response.encoded_audio:
+            elif encoded:
                 # Response contains base64 encoded audio
-                print("Decoding base64 audio...")
-                audio_data = base64.b64decode(response.encoded_audio)
+                logger.debug("Decoding base64 audio...")
+                self._write_encoded_audio(filepath, encoded)
             
             else:
-                print("Unknown response format from Murf SDK")
+                logger.warning("Unknown response format from Murf SDK")
                 return None
             
-            # Save the audio file
-            timestamp = int(time.time() * 1000)
-            filename = f"ava_speech_{timestamp}.mp3"
+            return self._conversion_succeeded(cache_key, filepath)
+            
+        except Exception as e:
+            self._conversion_failed(e)
+            return None
+
+    async def text_to_speech_async(self, text: str, voice_id: Optional[str] = None,
+                                   style: Optional[str] = None, speed: float = 1.0) -> Optional[str]:
+        """
+        Convert text to speech using Murf SDK without blocking the event loop
+        
+        Args:
+            text: Text to convert to speech
+            voice_id: Voice ID to use (defaults to self.default_voice_id)
+            style: Speaking style (ignored for now)
+            speed: Speaking speed (ignored for now)
+            
+        Returns:
+            Path to the generated audio file or None if failed
+        """
+        # Without a shared async client, run the blocking conversion on a worker thread
+        if not self.async_murf_client:
+            return await asyncio.to_thread(self.text_to_speech, text, voice_id, style, speed)
+        
+        if not text or not text.strip():
+            return None
+        
+        # Use fallback immediately if Murf SDK is not working
+        if not self.use_murf:
+            return None  # Let the caller handle fallback
+        
+        voice_id = voice_id or self.default_voice_id
+        text = text.strip()
+        
+        # Identical phrases reuse the audio generated the first time
+        # (file system work runs on worker threads, off the event loop)
+        cache_key = self._cache_key(text, voice_id)
+        cached_path = await asyncio.to_thread(self._cache_lookup, cache_key)
+        if cached_path:
+            logger.debug("Using cached audio: %s", cached_path)
+            return cached_path
+        
+        try:
+            logger.debug("Converting text to speech: '%.50s'", text)
+            
+            response = await self.async_murf_client.text_to_speech.generate(
+                text=text,
+                voice_id=voice_id,
+                format=AUDIO_FORMAT,
+                channel_type=AUDIO_CHANNELS,
+                sample_rate=AUDIO_SAMPLE_RATE
+            )
+            
+            # Audio file for this conversion
+            filename = f"{CACHE_PREFIX}{cache_key}.mp3"
             filepath = os.path.join(self.audio_folder, filename)
             
-            with open(filepath, 'wb') as f:
-                f.write(audio_data)
+            # Handle the response
+            audio_url = getattr(response, 'audio_file', None)
+            encoded = None if audio_url else getattr(response, 'encoded_audio', None)
+            if audio_url:
+                logger.debug("Downloading audio from: %s", audio_url)
+                async with _atomic_write_async(filepath) as write:
+                    await self._download_audio_async(audio_url, write)
+                
+            elif encoded:
+                logger.debug("Decoding base64 audio...")
+                await asyncio.to_thread(self._write_encoded_audio, filepath, encoded)
             
-            print(f"Audio saved to: {filepath}")
-            return filepath
+            else:
+                logger.warning("Unknown response format from Murf SDK")
+                return None
+            
+            return self._conversion_succeeded(cache_key, filepath)
+            
+        except Exception as e:
+            self._conversion_failed(e)
+            return None
+
+    async def text_to_speech_stream(self, text: str, voice_id: Optional[str] = None,
+                                    style: Optional[str] = None, speed: float = 1.0) -> Optional[AsyncIterator[bytes]]:
+        """
+        Convert text to speech and stream the audio as it arrives from Murf,
+        saving it to the audio cache on the way through
+        
+        Args:
+            text: Text to convert to speech
+            voice_id: Voice ID to use (defaults to self.default_voice_id)
+            style: Speaking style (ignored for now)
+            speed: Speaking speed (ignored for now)
+            
+        Returns:
+            Async iterator of audio chunks, or None if Murf could not start the
+            conversion (or no async client is configured)
+        """
+        if not text or not text.strip():
+            return None
+        
+        if not self.use_murf or not self.async_murf_client:
+            return None
+        
+        voice_id = voice_id or self.default_voice_id
+        text = text.strip()
+        cache_key = self._cache_key(text, voice_id)
+        filepath = os.path.join(self.audio_folder, f"{CACHE_PREFIX}{cache_key}.mp3")
+        
+        try:
+            logger.debug("Streaming text to speech: '%.50s'", text)
+            
+            response = await self.async_murf_client.text_to_speech.generate(
+                text=text,
+                voice_id=voice_id,
+                format=AUDIO_FORMAT,
+                channel_type=AUDIO_CHANNELS,
+                sample_rate=AUDIO_SAMPLE_RATE
+            )
+            
+            audio_url = getattr(response, 'audio_file', None)
+            encoded = None if audio_url else getattr(response, 'encoded_audio', None)
+            if audio_url:
+                # Open the download before returning so HTTP errors surface here
+                request = self.async_http_client.build_request("GET", audio_url, timeout=30)
+                download_response = await self.async_http_client.send(request, stream=True)
+                try:
+                    download_response.raise_for_status()
+                except Exception:
+                    await download_response.aclose()
+                    raise
+                chunks = download_response.aiter_bytes(chunk_size=AUDIO_CHUNK_SIZE)
+                return self._tee_to_cache(chunks, cache_key, filepath, download_response.aclose)
+            
+            elif encoded:
+                return self._tee_to_cache(self._decode_chunks(encoded), cache_key, filepath)
             
+            else:
+                logger.warning("Unknown response format from Murf SDK")
+                return None
+            
+        except Exception as e:
+            self._conversion_failed(e)
+            return None
+
+    async def _tee_to_cache(self, chunks: AsyncIterator[bytes], cache_key: str, filepath: str,
+                            on_close: Optional[Callable[[], Awaitable[None]]] = None) -> AsyncIterator[bytes]:
+        """Yield audio chunks while writing them to the cache file"""
+        try:
+            # An abandoned or failed stream removes its partial file instead of
+            # moving it into place
+            async with _atomic_write_async(filepath) as write:
+                async for chunk in chunks:
+                    await write(chunk)
+                    yield chunk
+            self._conversion_succeeded(cache_key, filepath)
         except Exception as e:
-            print(f"Error in Murf SDK text-to-speech conversion: {e}")
-            # Switch to fallback for future requests
+            self._conversion_failed(e)
+            raise
+        finally:
+            if on_close:
+                await on_close()
+
+    @staticmethod
+    async def _decode_chunks(encoded: str) -> AsyncIterator[bytes]:
+        """Decode base64 audio in chunks (each a multiple of 4 characters)"""
+        for i in range(0, len(encoded), AUDIO_CHUNK_SIZE):
+            yield base64.b64decode(encoded[i:i + AUDIO_CHUNK_SIZE])
+
+    def cached_audio_path(self, text: str, voice_id: Optional[str] = None) -> Optional[str]:
+        """
+        Look up previously generated audio without calling Murf
+        
+        Args:
+            text: Text that was converted
+            voice_id: Voice ID used (defaults to self.default_voice_id)
+            
+        Returns:
+            Path to the cached audio file or None on a miss
+        """
+        if not text or not text.strip():
+            return None
+        return self._cache_lookup(self._cache_key(text.strip(), voice_id or self.default_voice_id))
+
+    @staticmethod
+    def _write_encoded_audio(filepath: str, encoded: str):
+        """Decode base64 audio into `filepath`"""
+        with _atomic_write(filepath) as f:
+            # Decode in chunks (a multiple of 4 characters, so each one is
+            # valid base64) instead of holding the whole decoded file in memory
+            for i in range(0, len(encoded), AUDIO_CHUNK_SIZE):
+                f.write(base64.b64decode(encoded[i:i + AUDIO_CHUNK_SIZE]))
+
+    def _conversion_succeeded(self, cache_key: str, filepath: str) -> str:
+        """Record a finished conversion and return its audio path"""
+        self._cache_index[cache_key] = filepath
+        self._murf_verified = True
+        self._recent_murf_failures = 0
+        logger.debug("Audio saved to: %s", filepath)
+        return filepath
+
+    def _conversion_failed(self, error: Exception):
+        """Record a failed conversion"""
+        logger.error("Error in Murf SDK text-to-speech conversion: %s", error)
+        self._recent_murf_failures += 1
+        # Murf never worked: switch to fallback for future requests
+        if not self._murf_verified:
             self.use_murf = False
             self.use_fallback = True
+            self._voices_cache = None
+
+    @staticmethod
+    def _cache_key(text: str, voice_id: str) -> str:
+        """Cache key for a conversion: hash of the text, voice and output format"""
+        raw = f"{text}|{voice_id}|{AUDIO_FORMAT}|{AUDIO_SAMPLE_RATE}|{AUDIO_CHANNELS}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+    def _scan_audio_cache(self) -> dict:
+        """Index cached audio files already present in the audio folder"""
+        index = {}
+        try:
+            with os.scandir(self.audio_folder) as entries:
+                for entry in entries:
+                    if entry.name.startswith(CACHE_PREFIX) and entry.name.endswith(".mp3"):
+                        index[entry.name[len(CACHE_PREFIX):-4]] = entry.path
+        except OSError as e:
+            logger.error("Error scanning audio cache: %s", e)
+        return index
+
+    def _cache_lookup(self, cache_key: str) -> Optional[str]:
+        """
+        Find cached audio for a key and mark it as recently used
+        
+        Returns:
+            Path to the cached file or None on a miss
+        """
+        filepath = self._cache_index.get(cache_key)
+        if not filepath:
+            return None
+        
+        try:
+            # Touch the file so LRU cleanup sees the hit (atime updates are often disabled)
+            os.utime(filepath)
+            return filepath
+        except FileNotFoundError:
+            self._cache_index.pop(cache_key, None)
             return None
 
+    def _download_audio(self, url: str, f: BinaryIO):
+        """
+        Download generated audio to disk in chunks
+        
+        Args:
+            url: URL of the generated audio
+            f: Destination file opened for binary writing
+        """
+        if self.http_client is not None:
+            with self.http_client.stream("GET", url, timeout=30) as download_response:
+                download_response.raise_for_status()
+                for chunk in download_response.iter_bytes(chunk_size=AUDIO_CHUNK_SIZE):
+                    f.write(chunk)
+            return
+        
+        with self._http.get(url, timeout=30, stream=True) as download_response:
+            download_response.raise_for_status()
+            # Copy straight from the socket, undoing any gzip transfer encoding
+            download_response.raw.decode_content = True
+            shutil.copyfileobj(download_response.raw, f, length=AUDIO_CHUNK_SIZE)
+
+    async def _download_audio_async(self, url: str, write: Callable[[bytes], Awaitable[int]]):
+        """Stream audio from `url` into `write` chunk by chunk over the shared async client"""
+        async with self.async_http_client.stream("GET", url, timeout=30) as download_response:
+            download_response.raise_for_status()
+            async for chunk in download_response.aiter_bytes(chunk_size=AUDIO_CHUNK_SIZE):
+                await write(chunk)
+
     def play_audio(self, audio_path: str, callback: Optional[callable] = None):
         """
         Play audio file
@@ -195,46 +583,63 @@ class MurfTTS:
             callback: Optional callback function to call when playback finishes
         """
         if not os.path.exists(audio_path):
-            print(f"Audio file not found: {audio_path}")
+            logger.warning("Audio file not found: %s", audio_path)
             return
         
-        def play_in_thread():
+        self._play_queue.put((audio_path, callback))
+
+    def _player_loop(self):
+        """Play queued audio files one after another"""
+        while True:
+            audio_path, callback = self._play_queue.get()
             try:
-                self.is_playing = True
-                print(f"Playing audio: {audio_path}")
-                
-                self.current_player = AudioPlayer(audio_path)
-                self.current_player.play(block=True)
-                
-                self.is_playing = False
-                print("Audio playback completed")
+                if audio_path:
+                    self.is_playing = True
+                    self._play_blocking(audio_path)
+                    self.is_playing = False
+                    logger.debug("Audio playback completed")
                 
                 if callback:
                     callback()
                     
             except Exception as e:
-                print(f"Error playing audio: {e}")
+                logger.error("Error playing audio: %s", e)
                 self.is_playing = False
+
+    def _play_blocking(self, audio_path: str):
+        """Play an audio file on the calling thread until it finishes"""
+        from audioplayer import AudioPlayer  # loaded on first playback
         
-        # Play audio in separate thread to avoid blocking UI
-        audio_thread = threading.Thread(target=play_in_thread, daemon=True)
-        audio_thread.start()
+        logger.debug("Playing audio: %s", audio_path)
+        self.current_player = AudioPlayer(audio_path)
+        self.current_player.play(block=True)
 
     def stop_audio(self):
         """Stop currently playing audio"""
+        self._stop_requested.set()
+        
         # Stop fallback TTS if being used
         if self.use_fallback and self.fallback_tts:
             self.fallback_tts.stop_audio()
             return
             
+        # Drop playback that hasn't started yet
+        while True:
+            try:
+                _, callback = self._play_queue.get_nowait()
+            except queue.Empty:
+                break
+            if callback:
+                callback()
+        
         # Stop regular audio playback
         if self.current_player and self.is_playing:
             try:
                 self.current_player.close()
                 self.is_playing = False
-                print("Audio playback stopped")
+                logger.info("Audio playback stopped")
             except Exception as e:
-                print(f"Error stopping audio: {e}")
+                logger.error("Error stopping audio: %s", e)
 
     def speak_text(self, text: str, voice_id: Optional[str] = None, 
                   style: Optional[str] = None, callback: Optional[Callable] = None):
@@ -249,16 +654,19 @@ class MurfTTS:
         """
         # Use fallback TTS if Murf API is not available
         if self.use_fallback and self.fallback_tts:
-            print("🔄 Using fallback TTS...")
+            logger.info("🔄 Using fallback TTS...")
             self.fallback_tts.speak_text(text, callback)
             return
             
         def speak_in_thread():
-            audio_path = self.text_to_speech(text, voice_id, style)
+            if self.race_fallback and self._recent_murf_failures:
+                audio_path = self._race_synthesis(text, voice_id, style)
+            else:
+                audio_path = self.text_to_speech(text, voice_id, style)
             if audio_path:
                 self.play_audio(audio_path, callback)
             else:
-                print("Failed to generate speech with Murf, trying fallback...")
+                logger.warning("Failed to generate speech with Murf, trying fallback...")
                 if self.fallback_tts:
                     self.fallback_tts.speak_text(text, callback)
                 elif callback:
@@ -268,6 +676,88 @@ class MurfTTS:
         speak_thread = threading.Thread(target=speak_in_thread, daemon=True)
         speak_thread.start()
 
+    def _race_synthesis(self, text: str, voice_id: Optional[str] = None,
+                        style: Optional[str] = None) -> Optional[str]:
+        """
+        Synthesize with Murf and the fallback engine concurrently
+        
+        Args:
+            text: Text to convert to speech
+            voice_id: Murf voice ID to use
+            style: Speaking style
+            
+        Returns:
+            Path to whichever audio file is ready first, or None if both failed
+        """
+        fallback_path = os.path.join(self.audio_folder, f"ava_speech_{int(time.time() * 1000)}.wav")
+        pending = {
+            self._race_pool.submit(self.text_to_speech, text, voice_id, style),
+            self._race_pool.submit(self.fallback_tts.synthesize_to_file, text, fallback_path),
+        }
+        
+        # The losing engine finishes in the background; its file is left for
+        # cleanup_audio_files (or the Murf cache)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None and future.result():
+                    return future.result()
+        return None
+
+    def speak_chunks(self, chunks: List[str], voice_id: Optional[str] = None,
+                     style: Optional[str] = None, callback: Optional[Callable] = None):
+        """
+        Speak a sequence of text chunks (e.g. sentences), synthesizing the next
+        chunk while the current one plays so there is no gap between them
+        
+        Args:
+            chunks: Text chunks to speak in order
+            voice_id: Voice ID to use
+            style: Speaking style
+            callback: Optional callback when all chunks have been spoken
+        """
+        chunks = [chunk for chunk in chunks if chunk and chunk.strip()]
+        if not chunks:
+            if callback:
+                callback()
+            return
+        
+        # Fallback TTS already speaks queued utterances back to back
+        if self.use_fallback and self.fallback_tts:
+            logger.info("🔄 Using fallback TTS...")
+            for chunk in chunks[:-1]:
+                self.fallback_tts.speak_text(chunk)
+            self.fallback_tts.speak_text(chunks[-1], callback)
+            return
+        
+        def speak_pipeline():
+            self._stop_requested.clear()
+            
+            # Chunks go through the player queue, so the next one is
+            # synthesized here while the player thread plays the current one,
+            # and stop_audio drops whatever hasn't played yet
+            for i, chunk in enumerate(chunks):
+                audio_path = self.text_to_speech(chunk, voice_id, style)
+                if self._stop_requested.is_set():
+                    break
+                
+                if not audio_path:
+                    logger.warning("Failed to generate speech for chunk %d, skipping", i + 1)
+                    continue
+                
+                self._play_queue.put((audio_path, None))
+            
+            if self._stop_requested.is_set():
+                if callback:
+                    callback()
+            else:
+                # Runs the callback once the last chunk has played
+                self._play_queue.put((None, callback))
+        
+        # Run in separate thread to avoid blocking
+        speak_thread = threading.Thread(target=speak_pipeline, daemon=True)
+        speak_thread.start()
+
     def test_connection(self) -> bool:
         """
         Test connection to Murf SDK or fallback TTS
@@ -285,36 +775,52 @@ class MurfTTS:
         
         return False
 
-    def cleanup_audio_files(self, max_files: int = 10):
+    def cleanup_audio_files(self, max_files: int = 10, max_cached: int = MAX_CACHED_AUDIO):
         """
         Clean up old audio files to save disk space
         
         Args:
-            max_files: Maximum number of audio files to keep
+            max_files: Maximum number of one-off (ava_speech_*) audio files to keep
+            max_cached: Maximum number of cached (ava_cache_*) audio files to keep
         """
         try:
-            audio_files = []
-            for filename in os.listdir(self.audio_folder):
-                if filename.startswith("ava_speech_") and filename.endswith(".mp3"):
-                    filepath = os.path.join(self.audio_folder, filename)
-                    creation_time = os.path.getctime(filepath)
-                    audio_files.append((filepath, creation_time))
-            
-            # Sort by creation time (newest first)
-            audio_files.sort(key=lambda x: x[1], reverse=True)
+            # scandir yields the path and cached stat info in one directory pass
+            speech_files = []
+            cached_files = []
+            with os.scandir(self.audio_folder) as entries:
+                for entry in entries:
+                    if not entry.name.endswith((".mp3", ".wav")):
+                        continue
+                    if entry.name.startswith("ava_speech_"):
+                        speech_files.append((entry.path, entry.name, entry.stat().st_mtime))
+                    elif entry.name.startswith(CACHE_PREFIX):
+                        cached_files.append((entry.path, entry.name, entry.stat().st_atime))
             
-            # Remove old files if we have too many
-            if len(audio_files) > max_files:
-                files_to_remove = audio_files[max_files:]
-                for filepath, _ in files_to_remove:
+            # Remove the oldest one-off files and least recently used cached files
+            for audio_files, keep in ((speech_files, max_files), (cached_files, max_cached)):
+                if len(audio_files) <= keep:
+                    continue
+                
+                # Only the excess needs ordering, by modification/access time (oldest first)
+                excess = heapq.nsmallest(len(audio_files) - keep, audio_files, key=lambda x: x[2])
+                
+                for filepath, filename, _ in excess:
                     try:
-                        os.remove(filepath)
-                        print(f"Removed old audio file: {os.path.basename(filepath)}")
+                        os.unlink(filepath)
+                        if filename.startswith(CACHE_PREFIX):
+                            self._cache_index.pop(filename[len(CACHE_PREFIX):-4], None)
+                        logger.debug("Removed old audio file: %s", filename)
                     except Exception as e:
-                        print(f"Error removing file {filepath}: {e}")
+                        logger.error("Error removing file %s: %s", filepath, e)
                         
         except Exception as e:
-            print(f"Error during audio cleanup: {e}")
+            logger.error("Error during audio cleanup: %s", e)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_murf() -> MurfTTS:
+    """Shared MurfTTS instance for the convenience function, built on first use"""
+    return MurfTTS()
 
 
 # Convenience function for simple usage
@@ -330,19 +836,21 @@ def speak_text(text: str, voice_id: Optional[str] = None) -> bool:
         True if successful, False otherwise
     """
     try:
-        murf = MurfTTS()
+        murf = _get_murf()
         audio_path = murf.text_to_speech(text, voice_id)
         if audio_path:
             murf.play_audio(audio_path)
             return True
         return False
     except Exception as e:
-        print(f"Error speaking text: {e}")
+        logger.error("Error speaking text: %s", e)
         return False
 
 
 if __name__ == "__main__":
     # Test the Murf TTS functionality
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     print("Testing Murf TTS Integration...")
     
     try:
@@ -5,9 +5,24 @@ Handles speech recognition and audio recording
 
 import speech_recognition as sr
 import pyaudio
+import io
+import os
+import logging
 import threading
 import time
 from typing import Optional, Callable
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Seconds between ambient noise recalibrations in continuous listening
+RECALIBRATION_INTERVAL = 30
+
+# Maximum phrases being recognized at once in continuous listening
+MAX_RECOGNITION_WORKERS = 4
+
+# Local Whisper model used when AVA_LOCAL_STT=1
+LOCAL_STT_MODEL = "tiny.en"
 
 
 class VoiceInput:
@@ -17,11 +32,62 @@ class VoiceInput:
         self.is_listening = False
         self.audio_data = None
         
+        # Bounded pool for recognizing phrases captured in continuous mode
+        self._recog_pool = ThreadPoolExecutor(max_workers=MAX_RECOGNITION_WORKERS, thread_name_prefix="stt")
+        
+        # Optional on-device recognition, skipping the Google STT round-trip
+        # (faster-whisper is only imported when enabled, it is slow to load)
+        self._local_stt = None
+        if os.getenv("AVA_LOCAL_STT") == "1":
+            try:
+                from faster_whisper import WhisperModel
+            except ImportError:
+                logger.warning("AVA_LOCAL_STT is set but faster-whisper is not installed. Install with: pip install faster-whisper")
+            else:
+                try:
+                    self._local_stt = WhisperModel(LOCAL_STT_MODEL, device="cpu", compute_type="int8")
+                    logger.info("Local speech recognition enabled (%s)", LOCAL_STT_MODEL)
+                except Exception as e:
+                    logger.warning("Could not load local speech recognition, using Google: %s", e)
+        
         # Adjust for ambient noise on initialization
         with self.microphone as source:
-            print("Calibrating microphone for ambient noise...")
+            logger.info("Calibrating microphone for ambient noise...")
             self.recognizer.adjust_for_ambient_noise(source, duration=1)
-            print("Microphone calibrated!")
+            logger.info("Microphone calibrated!")
+        self._last_calibration = time.monotonic()
+
+    def _recognize(self, audio: sr.AudioData) -> str:
+        """
+        Transcribe captured audio, locally when enabled, otherwise with Google
+        
+        Args:
+            audio: Captured audio
+            
+        Returns:
+            Transcribed text
+            
+        Raises:
+            sr.UnknownValueError: If no speech could be recognized
+            sr.RequestError: If the Google recognition service failed
+        """
+        if self._local_stt:
+            try:
+                segments, _ = self._local_stt.transcribe(
+                    io.BytesIO(audio.get_wav_data()),
+                    beam_size=1,
+                    vad_filter=True
+                )
+                text = "".join(segment.text for segment in segments).strip()
+                if not text:
+                    raise sr.UnknownValueError()
+                return text
+            except sr.UnknownValueError:
+                raise
+            except Exception as e:
+                logger.warning("Local speech recognition failed, using Google: %s", e)
+        
+        return self.recognizer.recognize_google(audio)
 
     def listen_once(self, timeout: int = 5, phrase_time_limit: int = 10) -> Optional[str]:
         """
@@ -36,7 +102,7 @@ class VoiceInput:
         """
         try:
             with self.microphone as source:
-                print("Listening...")
+                logger.debug("Listening...")
                 # Listen for audio with timeout
                 audio = self.recognizer.listen(
                     source, 
@@ -44,23 +110,22 @@ class VoiceInput:
                     phrase_time_limit=phrase_time_limit
                 )
                 
-            print("Processing speech...")
-            # Use Google's speech recognition
-            text = self.recognizer.recognize_google(audio)
-            print(f"Recognized: {text}")
+            logger.debug("Processing speech...")
+            text = self._recognize(audio)
+            logger.debug("Recognized: %s", text)
             return text
             
         except sr.WaitTimeoutError:
-            print("Listening timeout - no speech detected")
+            logger.debug("Listening timeout - no speech detected")
             return None
         except sr.UnknownValueError:
-            print("Could not understand audio")
+            logger.debug("Could not understand audio")
             return None
         except sr.RequestError as e:
-            print(f"Speech recognition error: {e}")
+            logger.error("Speech recognition error: %s", e)
             return None
         except Exception as e:
-            print(f"Unexpected error during speech recognition: {e}")
+            logger.error("Unexpected error during speech recognition: %s", e)
             return None
 
     def listen_continuously(self, callback: Callable[[str], None], stop_event: threading.Event):
@@ -71,13 +136,15 @@ class VoiceInput:
             callback: Function to call with recognized text
             stop_event: Event to signal when to stop listening
         """
-        print("Starting continuous listening...")
+        logger.info("Starting continuous listening...")
         
         while not stop_event.is_set():
             try:
                 with self.microphone as source:
-                    # Quick ambient noise adjustment
-                    self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
+                    # Quick ambient noise adjustment, only every so often
+                    if time.monotonic() - self._last_calibration > RECALIBRATION_INTERVAL:
+                        self.recognizer.adjust_for_ambient_noise(source, duration=0.3)
+                        self._last_calibration = time.monotonic()
                     
                     # Listen for audio
                     audio = self.recognizer.listen(source, timeout=1, phrase_time_limit=5)
@@ -85,23 +152,22 @@ class VoiceInput:
                 # Recognize speech in background thread
                 def recognize_audio():
                     try:
-                        text = self.recognizer.recognize_google(audio)
+                        text = self._recognize(audio)
                         if text.strip():
                             callback(text)
                     except sr.UnknownValueError:
                         pass  # Ignore unrecognized audio
                     except sr.RequestError as e:
-                        print(f"Recognition service error: {e}")
+                        logger.error("Recognition service error: %s", e)
                         
-                # Start recognition in separate thread to avoid blocking
-                recognition_thread = threading.Thread(target=recognize_audio, daemon=True)
-                recognition_thread.start()
+                # Recognize on the pool so listening isn't blocked
+                self._recog_pool.submit(recognize_audio)
                 
             except sr.WaitTimeoutError:
                 # Timeout is expected in continuous mode
                 continue
             except Exception as e:
-                print(f"Error in continuous listening: {e}")
+                logger.error("Error in continuous listening: %s", e)
                 time.sleep(1)  # Brief pause before retrying
 
     def test_microphone(self) -> bool:
@@ -120,9 +186,13 @@ class VoiceInput:
             # Timeout is normal - microphone is accessible but no speech
             return True
         except Exception as e:
-            print(f"Microphone test failed: {e}")
+            logger.error("Microphone test failed: %s", e)
             return False
 
+    def close(self):
+        """Release the recognition worker threads"""
+        self._recog_pool.shutdown(wait=False)
+
     def list_microphones(self) -> list:
         """
         Get list of available microphones
@@ -150,6 +220,8 @@ def record_and_transcribe(timeout: int = 5) -> Optional[str]:
 
 if __name__ == "__main__":
     # Test the voice input functionality
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     print("Testing Voice Input...")
     
     voice = VoiceInput()
@@ -15,6 +15,7 @@ Created: 2025
 import flet as ft
 import sys
 import os
+import logging
 from pathlib import Path
 
 # Add the project root to Python path
@@ -110,6 +111,8 @@ def check_environment():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     print("🤖 Starting Ava AI Voice Assistant...")
     print("=" * 50)
     
@@ -5,6 +5,7 @@ Tests all core components individually
 
 import sys
 import os
+import logging
 from pathlib import Path
 
 # Add the project root to Python path
@@ -245,6 +246,8 @@ def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     try:
         success = main()
         sys.exit(0 if success else 1)
@@ -6,6 +6,7 @@ Handles the chat interface and user interactions
 import flet as ft
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Optional
 
@@ -198,27 +199,36 @@ class AvaLayout:
 
     def initialize_services(self):
         """Initialize AI services in background"""
+        def start_service(factory, probe):
+            service = factory()
+            return service, getattr(service, probe)()
+        
         def init_services():
             try:
-                self.update_status("Initializing voice recognition...", ft.Colors.ORANGE)
+                self.update_status("Initializing AI services...", ft.Colors.ORANGE)
+                
+                # The mic check and the Gemini/Murf handshakes are independent,
+                # so run them side by side instead of one after another
+                with ThreadPoolExecutor(max_workers=3) as pool:
+                    voice_future = pool.submit(start_service, VoiceInput, "test_microphone")
+                    gemini_future = pool.submit(start_service, GeminiResponse, "test_connection")
+                    murf_future = pool.submit(start_service, MurfTTS, "test_connection")
                 
                 # Initialize voice input
-                self.voice_input = VoiceInput()
-                if not self.voice_input.test_microphone():
+                self.voice_input, voice_ok = voice_future.result()
+                if not voice_ok:
                     self.show_error("Microphone Error", "Could not access microphone. Please check your microphone permissions.")
                     return
                 
-                self.update_status("Connecting to AI services...", ft.Colors.ORANGE)
-                
                 # Initialize Gemini
-                self.gemini_response = GeminiResponse()
-                if not self.gemini_response.test_connection():
+                self.gemini_response, gemini_ok = gemini_future.result()
+                if not gemini_ok:
                     self.show_error("AI Service Error", "Could not connect to Gemini AI. Please check your API key.")
                     return
                 
                 # Initialize Murf TTS
-                self.murf_tts = MurfTTS()
-                if not self.murf_tts.test_connection():
+                self.murf_tts, murf_ok = murf_future.result()
+                if not murf_ok:
                     self.show_error("TTS Service Error", "Could not connect to Murf TTS. Please check your API key.")
                     return
                 
@@ -33,7 +33,6 @@ export interface VoiceRequest {
 
 export interface GeminiRequest {
   text: string;
-  conversation_history?: any[];
 }
 
 export interface TTSRequest {
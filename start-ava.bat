@@ -15,7 +15,7 @@ if not exist .env (
 
 echo.
 echo [2] Step 2: Installing FastAPI dependencies...
-pip install -q fastapi uvicorn python-multipart
+pip install -q fastapi "uvicorn[standard]" python-multipart
 if %errorlevel% neq 0 (
     echo [X] Failed to install FastAPI dependencies
     pause